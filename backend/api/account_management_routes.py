@@ -59,7 +59,7 @@ async def list_user_accounts(session_token: str, db: Session = Depends(get_db)):
                 current_cash=float(account.current_cash),
                 frozen_cash=float(account.frozen_cash),
                 account_type=account.account_type,
-                is_active=account.is_active == "true"
+                is_active=account.is_active
             )
             for account in accounts
         ]
@@ -109,7 +109,7 @@ async def create_trading_account(
             current_cash=float(account.current_cash),
             frozen_cash=float(account.frozen_cash),
             account_type=account.account_type,
-            is_active=account.is_active == "true"
+            is_active=account.is_active
         )
         
     except HTTPException:
@@ -147,7 +147,7 @@ async def get_account_details(
             current_cash=float(account.current_cash),
             frozen_cash=float(account.frozen_cash),
             account_type=account.account_type,
-            is_active=account.is_active == "true"
+            is_active=account.is_active
         )
         
     except HTTPException:
@@ -202,7 +202,7 @@ async def update_trading_account(
             current_cash=float(updated_account.current_cash),
             frozen_cash=float(updated_account.frozen_cash),
             account_type=updated_account.account_type,
-            is_active=updated_account.is_active == "true"
+            is_active=updated_account.is_active
         )
         
     except HTTPException:
@@ -260,7 +260,7 @@ async def get_or_create_default(
             current_cash=float(account.current_cash),
             frozen_cash=float(account.frozen_cash),
             account_type=account.account_type,
-            is_active=account.is_active == "true"
+            is_active=account.is_active
         )
         
     except HTTPException:
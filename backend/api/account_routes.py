@@ -43,7 +43,7 @@ async def list_all_accounts(db: Session = Depends(get_db)):
     """Get all active accounts (for paper trading demo)"""
     try:
         from database.models import User
-        accounts = db.query(Account).filter(Account.is_active == "true").all()
+        accounts = db.query(Account).filter(Account.is_active.is_(True)).all()
         
         result = []
         for account in accounts:
@@ -61,7 +61,7 @@ async def list_all_accounts(db: Session = Depends(get_db)):
                 "model": account.model,
                 "base_url": account.base_url,
                 # NOTE: api_key intentionally excluded for security
-                "is_active": account.is_active == "true"
+                "is_active": account.is_active
             })
         
         return result
@@ -77,7 +77,7 @@ async def get_specific_account_overview(account_id: int, db: Session = Depends(g
         # Get the specific account
         account = db.query(Account).filter(
             Account.id == account_id,
-            Account.is_active == "true"
+            Account.is_active.is_(True)
         ).first()
         
         if not account:
@@ -124,7 +124,7 @@ async def get_account_overview(db: Session = Depends(get_db)):
     """Get overview for the default account (for paper trading demo)"""
     try:
         # Get the first active account (default account)
-        account = db.query(Account).filter(Account.is_active == "true").first()
+        account = db.query(Account).filter(Account.is_active.is_(True)).first()
         
         if not account:
             raise HTTPException(status_code=404, detail="No active account found")
@@ -207,7 +207,7 @@ async def create_new_account(payload: dict, db: Session = Depends(get_db)):
             initial_capital=float(payload.get("initial_capital", 10000.0)),
             current_cash=float(payload.get("initial_capital", 10000.0)),
             frozen_cash=0.0,
-            is_active="true"
+            is_active=True
         )
         
         db.add(new_account)
@@ -235,7 +235,7 @@ async def create_new_account(payload: dict, db: Session = Depends(get_db)):
             "model": new_account.model,
             "base_url": new_account.base_url,
             # NOTE: api_key intentionally excluded for security
-            "is_active": new_account.is_active == "true"
+            "is_active": new_account.is_active
         }
     except HTTPException:
         raise
@@ -252,7 +252,7 @@ async def update_account_settings(account_id: int, payload: dict, db: Session =
         
         account = db.query(Account).filter(
             Account.id == account_id,
-            Account.is_active == "true"
+            Account.is_active.is_(True)
         ).first()
         
         if not account:
@@ -306,7 +306,7 @@ async def update_account_settings(account_id: int, payload: dict, db: Session =
             "model": account.model,
             "base_url": account.base_url,
             # NOTE: api_key intentionally excluded for security
-            "is_active": account.is_active == "true"
+            "is_active": account.is_active
         }
     except HTTPException:
         raise
@@ -340,7 +340,7 @@ async def get_asset_curve_by_timeframe(
         period = timeframe_map[timeframe]
         
         # Get all active accounts
-        accounts = db.query(Account).filter(Account.is_active == "true").all()
+        accounts = db.query(Account).filter(Account.is_active.is_(True)).all()
         if not accounts:
             return []
         
@@ -3,55 +3,65 @@
 import sqlite3
 import sys
 
+from db_utils import get_conn, ensure_account_indexes, load_valid_model_ids
+
+BANNER = "=" * 80
+
 def check_accounts():
     db_path = "data.db"
 
     try:
-        conn = sqlite3.connect(db_path)
+        valid_model_ids = load_valid_model_ids()
+        conn = get_conn(db_path)
+        ensure_account_indexes(conn)
         cursor = conn.cursor()
 
-        # Query accounts table
-        cursor.execute("""
-            SELECT id, name, account_type, ai_model_id, is_active, current_cash
-            FROM accounts
-            ORDER BY id
-        """)
-
-        accounts = cursor.fetchall()
+        # Count first so rows can be streamed instead of fetched into a list
+        cursor.execute("SELECT COUNT(*) FROM accounts")
+        account_count = cursor.fetchone()[0]
 
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("ACCOUNTS TABLE ANALYSIS")
-        print("="*80)
+        print(BANNER)
 
-        if not accounts:
+        if not account_count:
             print("\nNo accounts found in database.")
             return
 
-        print(f"\nFound {len(accounts)} account(s):\n")
+        print(f"\nFound {account_count} account(s):\n")
 
-        for acc in accounts:
+        # Query accounts table
+        cursor.execute("""
+            SELECT id, name, account_type, ai_model_id, is_active, current_cash
+            FROM accounts
+            ORDER BY id
+        """)
+
+        for acc in cursor:
             acc_id, name, acc_type, ai_model_id, is_active, cash = acc
-            print(f"Account ID: {acc_id}")
-            print(f"  Name: {name}")
-            print(f"  Type: {acc_type}")
-            print(f"  AI Model ID: {ai_model_id if ai_model_id else 'NULL (NOT SET)'}")
-            print(f"  Active: {is_active}")
-            print(f"  Current Cash: ${cash}")
+            # 1/0 after the is_active BOOLEAN migration, 'true'/'false' on unmigrated databases
+            active = is_active in (1, "true")
 
             # Check if this account would be skipped for AI trading
-            if acc_type == "AI":
-                if not ai_model_id:
-                    print(f"  [X] PROBLEM: No AI model configured - AI trading DISABLED")
-                else:
-                    valid_models = ["gpt-4o-mini", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo", "claude-3-opus", "claude-3-sonnet"]
-                    if ai_model_id in valid_models:
-                        print(f"  [OK] AI model configured correctly")
-                    else:
-                        print(f"  [X] PROBLEM: Invalid AI model ID - AI trading DISABLED")
+            if acc_type != "AI":
+                status = "  [INFO] Not an AI account - AI trading not applicable"
+            elif not ai_model_id:
+                status = "  [X] PROBLEM: No AI model configured - AI trading DISABLED"
+            elif ai_model_id in valid_model_ids:
+                status = "  [OK] AI model configured correctly"
             else:
-                print(f"  [INFO] Not an AI account - AI trading not applicable")
-
-            print()
+                status = "  [X] PROBLEM: Invalid AI model ID - AI trading DISABLED"
+
+            # One write per account instead of one print per line
+            sys.stdout.write("\n".join((
+                f"Account ID: {acc_id}",
+                f"  Name: {name}",
+                f"  Type: {acc_type}",
+                f"  AI Model ID: {ai_model_id if ai_model_id else 'NULL (NOT SET)'}",
+                f"  Active: {'true' if active else 'false'}",
+                f"  Current Cash: ${cash}",
+                status,
+            )) + "\n\n")
 
         # Check for accounts that need fixing
         cursor.execute("""
@@ -63,16 +73,14 @@ def check_accounts():
         broken_accounts = cursor.fetchall()
 
         if broken_accounts:
-            print("="*80)
+            print(BANNER)
             print("ACCOUNTS NEEDING FIX")
-            print("="*80)
+            print(BANNER)
             print(f"\nFound {len(broken_accounts)} AI account(s) without ai_model_id:\n")
             for acc_id, name in broken_accounts:
                 print(f"  - {name} (ID: {acc_id})")
             print()
 
-        conn.close()
-
     except sqlite3.Error as e:
         print(f"Database error: {e}", file=sys.stderr)
         sys.exit(1)
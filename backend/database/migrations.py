@@ -0,0 +1,40 @@
+"""
+In-place schema migrations for existing SQLite databases
+
+Base.metadata.create_all() only creates missing tables, so column changes on
+existing tables are applied here on startup. Each migration is idempotent.
+"""
+
+import logging
+
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_account_is_active(engine: Engine):
+    """
+    Convert accounts.is_active from 'true'/'false' strings to a BOOLEAN (0/1) column
+
+    Does nothing for new databases or ones that were already migrated.
+    Requires SQLite >= 3.35 (ALTER TABLE ... DROP COLUMN).
+    """
+    with engine.begin() as conn:
+        columns = {row[1]: row[2] for row in conn.exec_driver_sql("PRAGMA table_info(accounts)")}
+        if not columns or columns.get("is_active", "").upper() == "BOOLEAN":
+            return
+
+        # is_active may already be gone if a previous run stopped before the rename
+        if "is_active" in columns:
+            if "is_active_int" not in columns:
+                conn.exec_driver_sql(
+                    "ALTER TABLE accounts ADD COLUMN is_active_int BOOLEAN NOT NULL DEFAULT 1"
+                )
+            conn.exec_driver_sql(
+                "UPDATE accounts SET is_active_int = CASE is_active WHEN 'true' THEN 1 ELSE 0 END"
+            )
+            conn.exec_driver_sql("ALTER TABLE accounts DROP COLUMN is_active")
+
+        conn.exec_driver_sql("ALTER TABLE accounts RENAME COLUMN is_active_int TO is_active")
+
+    logger.info("Migrated accounts.is_active to BOOLEAN")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, TIMESTAMP, ForeignKey, UniqueConstraint, Float, Date, DateTime
+from sqlalchemy import Column, Integer, String, DECIMAL, TIMESTAMP, ForeignKey, UniqueConstraint, Float, Date, DateTime, Index, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import datetime
@@ -40,7 +40,7 @@ class Account(Base):
     # Account Identity
     name = Column(String(100), nullable=False)  # Display name (e.g., "GPT Trader", "Claude Analyst")
     account_type = Column(String(20), nullable=False, default="AI")  # "AI" or "MANUAL"
-    is_active = Column(String(10), nullable=False, default="true")
+    is_active = Column(Boolean, nullable=False, default=True)
     
     # AI Model Configuration (for AI accounts)
     ai_model_id = Column(String(100), nullable=True)  # Reference to ai_models.json model ID
@@ -63,6 +63,8 @@ class Account(Base):
     positions = relationship("Position", back_populates="account")
     orders = relationship("Order", back_populates="account")
 
+    __table_args__ = (Index("ix_accounts_type_model", "account_type", "ai_model_id"),)
+
 
 class UserAuthSession(Base):
     __tablename__ = "user_auth_sessions"
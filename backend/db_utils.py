@@ -0,0 +1,82 @@
+"""Shared helpers for the account maintenance scripts"""
+import atexit
+import sqlite3
+import sys
+from functools import lru_cache
+
+from services.ai_config_loader import ai_config
+
+# WAL journal + NORMAL sync: commits append to the WAL without an extra fsync
+# per transaction; larger page cache (~64MB) and in-memory temp storage
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Used only when backend/ai_models.json is missing or invalid
+FALLBACK_MODEL_IDS = frozenset({
+    "gpt-4o-mini",
+    "gpt-4-turbo",
+    "gpt-4",
+    "gpt-3.5-turbo",
+    "claude-3-opus",
+    "claude-3-sonnet"
+})
+
+# Covers the "AI account without ai_model_id" lookups used by all three scripts
+ACCOUNT_TYPE_MODEL_INDEX = (
+    "CREATE INDEX IF NOT EXISTS ix_accounts_type_model "
+    "ON accounts (account_type, ai_model_id)"
+)
+
+
+@lru_cache(maxsize=None)
+def get_conn(db_path: str = "data.db") -> sqlite3.Connection:
+    """
+    Get the shared connection for a database file
+
+    The connection is opened once per path and reused by check_accounts,
+    fix_accounts and migrate_ai_accounts when they run in the same process.
+    It is opened in autocommit mode (isolation_level=None): writers manage
+    their own BEGIN IMMEDIATE / COMMIT. The statement cache is disabled
+    since each script runs only a handful of one-off statements. It is
+    configured with CONNECTION_PRAGMAS and closed automatically at
+    interpreter exit.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        sqlite3.Connection shared by all callers for this path
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=0)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    atexit.register(conn.close)
+    return conn
+
+
+def ensure_account_indexes(conn: sqlite3.Connection):
+    """Create the accounts indexes the scripts rely on (no-op if present)"""
+    conn.execute(ACCOUNT_TYPE_MODEL_INDEX)
+
+
+@lru_cache(maxsize=None)
+def load_valid_model_ids() -> frozenset:
+    """
+    Get the valid AI model IDs from ai_models.json via AIConfigLoader
+
+    Returns:
+        frozenset of configured model IDs, or FALLBACK_MODEL_IDS if the
+        config file does not exist or is invalid
+    """
+    try:
+        ai_config.load_config(verbose=False)
+    except FileNotFoundError:
+        return FALLBACK_MODEL_IDS
+    except ValueError as e:
+        print(f"Warning: {e}; using built-in model IDs", file=sys.stderr)
+        return FALLBACK_MODEL_IDS
+    return frozenset(ai_config.get_model_ids())
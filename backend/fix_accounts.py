@@ -3,12 +3,18 @@
 import sqlite3
 import sys
 
+from db_utils import get_conn, ensure_account_indexes
+
+BANNER = "=" * 80
+
 def fix_accounts():
     db_path = "data.db"
     default_model_id = "gpt-4o-mini"  # Use the working model from account 1
 
+    conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_conn(db_path)
+        ensure_account_indexes(conn)
         cursor = conn.cursor()
 
         # Find AI accounts without ai_model_id
@@ -22,12 +28,11 @@ def fix_accounts():
 
         if not broken_accounts:
             print("\nNo accounts need fixing. All AI accounts have ai_model_id set.")
-            conn.close()
             return
 
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("FIXING AI ACCOUNTS")
-        print("="*80)
+        print(BANNER)
         print(f"\nFound {len(broken_accounts)} AI account(s) to fix:\n")
 
         for acc_id, name in broken_accounts:
@@ -36,21 +41,25 @@ def fix_accounts():
         print(f"\nWill set ai_model_id to: {default_model_id}")
         print("\nProceeding with fix...")
 
-        # Update accounts
-        for acc_id, name in broken_accounts:
-            cursor.execute("""
-                UPDATE accounts
-                SET ai_model_id = ?
-                WHERE id = ?
-            """, (default_model_id, acc_id))
-            print(f"  [OK] Updated {name} (ID: {acc_id})")
+        # Update all matching accounts in a single set-based statement
+        conn.execute("BEGIN IMMEDIATE")
+        cursor.execute("""
+            UPDATE accounts
+            SET ai_model_id = ?
+            WHERE account_type = 'AI' AND (ai_model_id IS NULL OR ai_model_id = '')
+            RETURNING id, name
+        """, (default_model_id,))
+
+        updated_accounts = cursor.fetchall()
+        conn.execute("COMMIT")
 
-        conn.commit()
+        for acc_id, name in updated_accounts:
+            print(f"  [OK] Updated {name} (ID: {acc_id})")
 
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("FIX COMPLETE")
-        print("="*80)
-        print(f"\nSuccessfully updated {len(broken_accounts)} account(s).")
+        print(BANNER)
+        print(f"\nSuccessfully updated {len(updated_accounts)} account(s).")
         print("\nVerifying changes...\n")
 
         # Verify the changes
@@ -67,24 +76,20 @@ def fix_accounts():
             status = "[OK]" if ai_model_id else "[X]"
             print(f"{status} Account {acc_id} ({name}): ai_model_id = {ai_model_id}")
 
-        conn.close()
-
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("All AI accounts should now be enabled for AI trading.")
         print("Please restart the backend server to see the changes take effect.")
-        print("="*80 + "\n")
+        print(BANNER + "\n")
 
     except sqlite3.Error as e:
         print(f"Database error: {e}", file=sys.stderr)
-        if conn:
-            conn.rollback()
-            conn.close()
+        if conn and conn.in_transaction:
+            conn.execute("ROLLBACK")
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        if conn:
-            conn.rollback()
-            conn.close()
+        if conn and conn.in_transaction:
+            conn.execute("ROLLBACK")
         sys.exit(1)
 
 if __name__ == "__main__":
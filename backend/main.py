@@ -7,6 +7,7 @@ import os
 import logging
 
 from database.connection import engine, Base, SessionLocal
+from database.migrations import migrate_account_is_active
 from database.models import TradingConfig, User, Account, SystemConfig
 from config.settings import DEFAULT_TRADING_CONFIGS
 
@@ -48,6 +49,8 @@ def on_startup():
 
     # Create tables
     Base.metadata.create_all(bind=engine)
+    # Upgrade existing tables that create_all() does not alter
+    migrate_account_is_active(engine)
     # Seed trading configs if empty
     db: Session = SessionLocal()
     try:
@@ -122,7 +125,7 @@ def on_startup():
                 initial_capital=10000.0,  # $10,000 starting capital for crypto trading
                 current_cash=10000.0,
                 frozen_cash=0.0,
-                is_active="true"
+                is_active=True
             )
             db.add(default_account)
             db.commit()
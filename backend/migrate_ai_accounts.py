@@ -16,27 +16,25 @@ import sqlite3
 import sys
 import argparse
 
-VALID_MODEL_IDS = [
-    "gpt-4o-mini",
-    "gpt-4-turbo",
-    "gpt-4",
-    "gpt-3.5-turbo",
-    "claude-3-opus",
-    "claude-3-sonnet"
-]
+from db_utils import get_conn, ensure_account_indexes, load_valid_model_ids
+
+BANNER = "=" * 80
 
 def migrate_accounts(model_id: str, dry_run: bool = False):
     """Migrate AI accounts to have ai_model_id set"""
     db_path = "data.db"
+    valid_model_ids = load_valid_model_ids()
 
     # Validate model ID
-    if model_id not in VALID_MODEL_IDS:
+    if model_id not in valid_model_ids:
         print(f"Error: Invalid model ID '{model_id}'", file=sys.stderr)
-        print(f"Valid model IDs: {', '.join(VALID_MODEL_IDS)}", file=sys.stderr)
+        print(f"Valid model IDs: {', '.join(sorted(valid_model_ids))}", file=sys.stderr)
         sys.exit(1)
 
+    conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_conn(db_path)
+        ensure_account_indexes(conn)
         cursor = conn.cursor()
 
         # Find AI accounts without ai_model_id
@@ -50,15 +48,14 @@ def migrate_accounts(model_id: str, dry_run: bool = False):
 
         if not accounts_to_fix:
             print("\nNo migration needed. All AI accounts have ai_model_id set.")
-            conn.close()
             return 0
 
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         if dry_run:
             print("DRY RUN MODE - No changes will be made")
         else:
             print("MIGRATION: Setting ai_model_id for AI accounts")
-        print("="*80)
+        print(BANNER)
 
         print(f"\nFound {len(accounts_to_fix)} AI account(s) without ai_model_id:\n")
 
@@ -69,26 +66,30 @@ def migrate_accounts(model_id: str, dry_run: bool = False):
 
         if dry_run:
             print("\n[DRY RUN] Would update these accounts but not making changes.")
-            conn.close()
             return 0
 
         # Perform the migration
         print("\nApplying migration...")
 
-        for acc_id, name, _ in accounts_to_fix:
-            cursor.execute("""
-                UPDATE accounts
-                SET ai_model_id = ?
-                WHERE id = ?
-            """, (model_id, acc_id))
-            print(f"  [OK] Updated account {acc_id}: {name}")
+        # Update all matching accounts in a single set-based statement
+        conn.execute("BEGIN IMMEDIATE")
+        cursor.execute("""
+            UPDATE accounts
+            SET ai_model_id = ?
+            WHERE account_type = 'AI' AND (ai_model_id IS NULL OR ai_model_id = '')
+            RETURNING id, name
+        """, (model_id,))
 
-        conn.commit()
+        updated_accounts = cursor.fetchall()
+        conn.execute("COMMIT")
 
-        print("\n" + "="*80)
+        for acc_id, name in updated_accounts:
+            print(f"  [OK] Updated account {acc_id}: {name}")
+
+        print("\n" + BANNER)
         print("MIGRATION COMPLETE")
-        print("="*80)
-        print(f"\nSuccessfully updated {len(accounts_to_fix)} account(s).")
+        print(BANNER)
+        print(f"\nSuccessfully updated {len(updated_accounts)} account(s).")
 
         # Verify
         cursor.execute("""
@@ -104,29 +105,25 @@ def migrate_accounts(model_id: str, dry_run: bool = False):
         else:
             print(f"\n[WARNING] {remaining} AI account(s) still without ai_model_id.")
 
-        conn.close()
-
         print("\nPlease restart the backend server for changes to take effect.\n")
         return 0
 
     except sqlite3.Error as e:
         print(f"\nDatabase error: {e}", file=sys.stderr)
-        if conn:
-            conn.rollback()
-            conn.close()
+        if conn and conn.in_transaction:
+            conn.execute("ROLLBACK")
         return 1
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
-        if conn:
-            conn.rollback()
-            conn.close()
+        if conn and conn.in_transaction:
+            conn.execute("ROLLBACK")
         return 1
 
 def main():
     parser = argparse.ArgumentParser(
         description="Migrate AI accounts to have ai_model_id set",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"Valid model IDs:\n  " + "\n  ".join(VALID_MODEL_IDS)
+        epilog=f"Valid model IDs:\n  " + "\n  ".join(sorted(load_valid_model_ids()))
     )
     parser.add_argument(
         "--model-id",
@@ -1,3 +1,4 @@
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from database.models import Account, User
@@ -26,7 +27,7 @@ def create_account(
         initial_capital=initial_capital,
         current_cash=initial_capital,
         frozen_cash=0.0,
-        is_active="true"
+        is_active=True
     )
     db.add(account)
     db.commit()
@@ -36,15 +37,15 @@ def create_account(
 
 def get_account(db: Session, account_id: int) -> Optional[Account]:
     """Get account by ID"""
-    return db.query(Account).filter(Account.id == account_id).first()
+    return db.execute(select(Account).where(Account.id == account_id)).scalar_one_or_none()
 
 
 def get_accounts_by_user(db: Session, user_id: int, active_only: bool = True) -> List[Account]:
     """Get all accounts for a user"""
-    query = db.query(Account).filter(Account.user_id == user_id)
+    stmt = select(Account).where(Account.user_id == user_id)
     if active_only:
-        query = query.filter(Account.is_active == "true")
-    return query.all()
+        stmt = stmt.where(Account.is_active.is_(True))
+    return db.execute(stmt).scalars().all()
 
 
 def get_or_create_default_account(
@@ -84,22 +85,24 @@ def update_account(
     api_key: str = None
 ) -> Optional[Account]:
     """Update account information"""
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        return None
-    
-    if name is not None:
-        account.name = name
-    if model is not None:
-        account.model = model
-    if base_url is not None:
-        account.base_url = base_url
-    if api_key is not None:
-        account.api_key = api_key
-    
+    # NOTE: api_key is no longer an Account column (stored in ai_models.json) and is ignored
+    patch = {
+        field: value
+        for field, value in (("name", name), ("model", model), ("base_url", base_url))
+        if value is not None
+    }
+    if not patch:
+        return get_account(db, account_id)
+
+    # Single UPDATE of the changed columns, no SELECT/refresh round-trip
+    updated = db.query(Account).filter(Account.id == account_id).update(
+        patch, synchronize_session=False
+    )
     db.commit()
-    db.refresh(account)
-    return account
+    if not updated:
+        return None
+
+    return get_account(db, account_id)
 
 
 def update_account_cash(
@@ -109,7 +112,7 @@ def update_account_cash(
     frozen_cash: float = None
 ) -> Optional[Account]:
     """Update account cash balance"""
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = get_account(db, account_id)
     if not account:
         return None
     
@@ -124,11 +127,11 @@ def update_account_cash(
 
 def deactivate_account(db: Session, account_id: int) -> Optional[Account]:
     """Deactivate an account"""
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = get_account(db, account_id)
     if not account:
         return None
     
-    account.is_active = "false"
+    account.is_active = False
     db.commit()
     db.refresh(account)
     return account
@@ -136,11 +139,11 @@ def deactivate_account(db: Session, account_id: int) -> Optional[Account]:
 
 def activate_account(db: Session, account_id: int) -> Optional[Account]:
     """Activate an account"""
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = get_account(db, account_id)
     if not account:
         return None
 
-    account.is_active = "true"
+    account.is_active = True
     db.commit()
     db.refresh(account)
     return account
@@ -161,19 +164,23 @@ def delete_account(db: Session, account_id: int, user_id: int) -> dict:
     from database.models import Position, Order, Trade, AIDecisionLog
 
     # 1. Verify account exists and belongs to user
-    account = db.query(Account).filter(
-        Account.id == account_id,
-        Account.user_id == user_id
-    ).first()
+    account = db.execute(
+        select(Account).where(
+            Account.id == account_id,
+            Account.user_id == user_id
+        )
+    ).scalar_one_or_none()
 
     if not account:
         return {"success": False, "message": "Account not found or access denied"}
 
     # 2. Check if it's the last account for this user
-    account_count = db.query(Account).filter(
-        Account.user_id == user_id,
-        Account.is_active == "true"
-    ).count()
+    account_count = db.execute(
+        select(func.count(Account.id)).where(
+            Account.user_id == user_id,
+            Account.is_active.is_(True)
+        )
+    ).scalar_one()
 
     if account_count <= 1:
         return {"success": False, "message": "Cannot delete the last account"}
@@ -183,20 +190,14 @@ def delete_account(db: Session, account_id: int, user_id: int) -> dict:
         account_name = account.name
 
         # 3. Cascade delete related data (if not configured in DB models)
-        # Delete AI decisions first (foreign key to orders)
-        db.query(AIDecisionLog).filter(AIDecisionLog.account_id == account_id).delete()
-
-        # Delete trades (foreign key to orders)
-        db.query(Trade).filter(Trade.account_id == account_id).delete()
-
-        # Delete orders
-        db.query(Order).filter(Order.account_id == account_id).delete()
+        # Order matters: AI decisions and trades reference orders
+        for model in (AIDecisionLog, Trade, Order, Position):
+            db.execute(delete(model).where(model.account_id == account_id))
 
-        # Delete positions
-        db.query(Position).filter(Position.account_id == account_id).delete()
+        # 4. Delete the account itself (bulk DELETE skips loading its relationships)
+        db.execute(delete(Account).where(Account.id == account_id))
 
-        # 4. Delete the account itself
-        db.delete(account)
+        # Single commit for the whole cascade
         db.commit()
 
         return {"success": True, "message": f"Account '{account_name}' deleted successfully"}
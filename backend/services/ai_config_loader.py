@@ -7,11 +7,18 @@ API keys are stored securely in the config file and never exposed to the fronten
 
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+MODEL_FIELDS = ("id", "display_name", "model", "base_url", "api_key")
+_get_model_fields = itemgetter(*MODEL_FIELDS)
+
+
+@dataclass(slots=True, frozen=True)
 class AIModelConfig:
     """Configuration for a single AI model"""
     id: str
@@ -27,18 +34,23 @@ class AIConfigLoader:
     _instance = None
     _models: Dict[str, AIModelConfig] = {}
     _config_path: str = ""
+    _all_models_cache: Tuple[Mapping[str, str], ...] = ()
+    _model_ids_cache: Tuple[str, ...] = ()
+    _config_mtime: Optional[int] = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def load_config(self, config_path: str = None):
+    def load_config(self, config_path: str = None, verbose: bool = True):
         """
         Load AI model configurations from JSON file
 
         Args:
             config_path: Path to ai_models.json (defaults to backend/ai_models.json)
+            verbose: Print a summary of the loaded models to stdout
 
         Raises:
             FileNotFoundError: If config file doesn't exist
@@ -49,48 +61,58 @@ class AIConfigLoader:
             backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             config_path = os.path.join(backend_dir, "ai_models.json")
 
-        self._config_path = config_path
-
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(
-                f"AI models config file not found: {config_path}\n"
-                f"Please create it from ai_models.example.json template"
-            )
-
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in ai_models.json: {e}")
-
-        # Validate structure
-        if "models" not in config_data:
-            raise ValueError("ai_models.json must contain a 'models' array")
+        with self._lock:
+            self._config_path = config_path
 
-        models_list = config_data["models"]
-        if not isinstance(models_list, list):
-            raise ValueError("'models' must be an array")
+            if not os.path.exists(config_path):
+                raise FileNotFoundError(
+                    f"AI models config file not found: {config_path}\n"
+                    f"Please create it from ai_models.example.json template"
+                )
 
-        if len(models_list) == 0:
-            raise ValueError("At least one AI model must be configured")
+            # Stat before reading so a concurrent edit is picked up by the next reload
+            config_mtime = os.stat(config_path).st_mtime_ns
 
-        # Parse and validate each model
-        self._models.clear()
-        for idx, model_data in enumerate(models_list):
             try:
-                self._validate_and_add_model(model_data, idx)
-            except Exception as e:
-                raise ValueError(f"Invalid model at index {idx}: {e}")
-
-        print(f"[OK] Loaded {len(self._models)} AI model configurations")
-        for model_id, config in self._models.items():
-            print(f"  - {config.display_name} ({model_id})")
-
-    def _validate_and_add_model(self, model_data: dict, index: int):
-        """Validate and add a single model configuration"""
-        required_fields = ["id", "display_name", "model", "base_url", "api_key"]
-
-        for field in required_fields:
+                with open(config_path, 'rb') as f:
+                    config_data = json.loads(f.read())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in ai_models.json: {e}")
+
+            # Validate structure
+            if "models" not in config_data:
+                raise ValueError("ai_models.json must contain a 'models' array")
+
+            models_list = config_data["models"]
+            if not isinstance(models_list, list):
+                raise ValueError("'models' must be an array")
+
+            if len(models_list) == 0:
+                raise ValueError("At least one AI model must be configured")
+
+            # Parse and validate each model into a new map, then swap it in
+            # so readers never see a partially loaded configuration
+            models: Dict[str, AIModelConfig] = {}
+            for idx, model_data in enumerate(models_list):
+                try:
+                    self._validate_and_add_model(model_data, idx, models)
+                except Exception as e:
+                    raise ValueError(f"Invalid model at index {idx}: {e}")
+
+            # Build the cached views from the same map, under the same lock
+            self._models = models
+            self._all_models_cache = self._build_all_models(models)
+            self._model_ids_cache = tuple(models.keys())
+            self._config_mtime = config_mtime
+
+        if verbose:
+            print(f"[OK] Loaded {len(self._models)} AI model configurations")
+            for model_id, config in self._models.items():
+                print(f"  - {config.display_name} ({model_id})")
+
+    def _validate_and_add_model(self, model_data: dict, index: int, models: Dict[str, AIModelConfig]):
+        """Validate a single model configuration and add it to models"""
+        for field in MODEL_FIELDS:
             if field not in model_data:
                 raise ValueError(f"Missing required field: {field}")
             if not isinstance(model_data[field], str):
@@ -98,21 +120,33 @@ class AIConfigLoader:
             if not model_data[field].strip():
                 raise ValueError(f"Field '{field}' cannot be empty")
 
-        model_id = model_data["id"]
+        model_id, display_name, model, base_url, api_key = _get_model_fields(model_data)
 
-        if model_id in self._models:
+        if model_id in models:
             raise ValueError(f"Duplicate model ID: {model_id}")
 
         # Create config object
-        config = AIModelConfig(
+        models[model_id] = AIModelConfig(
             id=model_id,
-            display_name=model_data["display_name"],
-            model=model_data["model"],
-            base_url=model_data["base_url"].rstrip('/'),  # Remove trailing slash
-            api_key=model_data["api_key"]
+            display_name=display_name,
+            model=model,
+            base_url=base_url.rstrip('/'),  # Remove trailing slash
+            api_key=api_key
         )
 
-        self._models[model_id] = config
+    @staticmethod
+    def _build_all_models(models: Dict[str, AIModelConfig]) -> Tuple[Mapping[str, str], ...]:
+        """Build the read-only, API-safe view of the model configurations"""
+        return tuple(
+            MappingProxyType({
+                "id": config.id,
+                "display_name": config.display_name,
+                "model": config.model,
+                "base_url": config.base_url
+                # NOTE: api_key intentionally excluded for security
+            })
+            for config in models.values()
+        )
 
     def get_model_config(self, model_id: str) -> Optional[AIModelConfig]:
         """
@@ -126,36 +160,37 @@ class AIConfigLoader:
         """
         return self._models.get(model_id)
 
-    def get_all_models(self) -> List[Dict[str, str]]:
+    def get_all_models(self) -> Tuple[Mapping[str, str], ...]:
         """
         Get all available models (without API keys)
 
         Returns:
-            List of dicts with id, display_name, model, base_url (NO api_key)
+            Tuple of read-only mappings with id, display_name, model, base_url
+            (NO api_key). The snapshot is shared by all callers and rebuilt
+            only when the configuration is (re)loaded, so it cannot be mutated.
         """
-        return [
-            {
-                "id": config.id,
-                "display_name": config.display_name,
-                "model": config.model,
-                "base_url": config.base_url
-                # NOTE: api_key intentionally excluded for security
-            }
-            for config in self._models.values()
-        ]
+        return self._all_models_cache
 
-    def get_model_ids(self) -> List[str]:
-        """Get list of all available model IDs"""
-        return list(self._models.keys())
+    def get_model_ids(self) -> Tuple[str, ...]:
+        """Get all available model IDs (rebuilt when the configuration is reloaded)"""
+        return self._model_ids_cache
 
     def is_valid_model_id(self, model_id: str) -> bool:
         """Check if a model ID exists in configuration"""
         return model_id in self._models
 
     def reload_config(self):
-        """Reload configuration from disk (useful for runtime updates)"""
-        if self._config_path:
-            self.load_config(self._config_path)
+        """Reload configuration from disk if the file changed since the last load"""
+        if not self._config_path:
+            return
+
+        try:
+            if os.stat(self._config_path).st_mtime_ns == self._config_mtime:
+                return
+        except OSError:
+            pass  # Let load_config report the missing file
+
+        self.load_config(self._config_path)
 
 
 # Global singleton instance
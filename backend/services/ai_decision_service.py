@@ -6,7 +6,7 @@ import random
 import json
 import time
 from decimal import Decimal
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 import requests
 from sqlalchemy.orm import Session
@@ -312,10 +312,27 @@ def save_ai_decision(db: Session, account: Account, decision: Dict, portfolio: D
 def get_active_ai_accounts(db: Session) -> List[Account]:
     """Get all active AI accounts that have valid AI model configuration"""
     accounts = db.query(Account).filter(
-        Account.is_active == "true",
+        Account.is_active.is_(True),
         Account.account_type == "AI"
     ).all()
+    return _filter_valid_ai_accounts(accounts)
 
+
+def get_active_ai_account_display(db: Session) -> List[Tuple[str, str]]:
+    """
+    Get (name, model) of active AI accounts with valid AI model configuration
+
+    Selects only the columns needed for status reporting instead of full Account rows
+    """
+    rows = db.query(Account.name, Account.model, Account.ai_model_id).filter(
+        Account.is_active.is_(True),
+        Account.account_type == "AI"
+    ).all()
+    return [(row.name, row.model) for row in _filter_valid_ai_accounts(rows)]
+
+
+def _filter_valid_ai_accounts(accounts: list) -> list:
+    """Keep accounts (or rows with name/ai_model_id) whose AI model ID is configured"""
     if not accounts:
         logger.warning("⚠ AI Trading Disabled: No AI accounts found in database")
         return []
@@ -26,7 +26,7 @@ def get_all_asset_curves_data_new(db: Session, timeframe: str = "1h") -> List[Di
     """
     try:
         # Step 1: Get all active accounts
-        accounts = db.query(Account).filter(Account.is_active == "true").all()
+        accounts = db.query(Account).filter(Account.is_active.is_(True)).all()
         if not accounts:
             return []
         
@@ -225,7 +225,7 @@ def get_account_asset_curve(db: Session, account_id: int, timeframe: str = "1h")
         # Get the specific account
         account = db.query(Account).filter(
             Account.id == account_id,
-            Account.is_active == "true"
+            Account.is_active.is_(True)
         ).first()
         
         if not account:
@@ -8,6 +8,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import Dict, Set, Callable, Optional
+from contextlib import contextmanager
 import logging
 from datetime import datetime, date
 
@@ -43,6 +44,23 @@ class TaskScheduler:
     def is_running(self) -> bool:
         """Check if scheduler is running"""
         return self._started and self.scheduler and self.scheduler.running
+
+    @contextmanager
+    def paused(self):
+        """
+        Pause job processing while registering a batch of tasks
+
+        Jobs added inside the block are stored without waking the scheduler
+        for each one; processing resumes with a single wakeup on exit.
+        """
+        if not self.is_running():
+            self.start()
+
+        self.scheduler.pause()
+        try:
+            yield self
+        finally:
+            self.scheduler.resume()
     
     def add_account_snapshot_task(self, account_id: int, interval_seconds: int = 300):
         """
@@ -3,12 +3,7 @@
 import logging
 import threading
 
-from services.auto_trader import (
-    place_ai_driven_crypto_order,
-    place_random_crypto_order,
-    AUTO_TRADE_JOB_ID,
-    AI_TRADE_JOB_ID
-)
+from database.connection import SessionLocal
 from services.scheduler import start_scheduler, setup_market_tasks, task_scheduler
 
 logger = logging.getLogger(__name__)
@@ -21,22 +16,24 @@ def initialize_services():
         start_scheduler()
         logger.info("Scheduler service started")
 
-        # Set up market-related scheduled tasks
-        setup_market_tasks()
-        logger.info("Market scheduled tasks have been set up")
-
-        # Start automatic cryptocurrency trading simulation task (5-minute interval)
-        schedule_auto_trading(interval_seconds=300)
-        logger.info("Automatic cryptocurrency trading task started (5-minute interval)")
-
-        # Add price cache cleanup task (every 2 minutes)
-        from services.price_cache import clear_expired_prices
-        task_scheduler.add_interval_task(
-            task_func=clear_expired_prices,
-            interval_seconds=120,  # Clean every 2 minutes
-            task_id="price_cache_cleanup"
-        )
-        logger.info("Price cache cleanup task started (2-minute interval)")
+        # Register all startup tasks as one batch (single scheduler wakeup)
+        with task_scheduler.paused():
+            # Set up market-related scheduled tasks
+            setup_market_tasks()
+            logger.info("Market scheduled tasks have been set up")
+
+            # Start automatic cryptocurrency trading simulation task (5-minute interval)
+            schedule_auto_trading(interval_seconds=300)
+            logger.info("Automatic cryptocurrency trading task started (5-minute interval)")
+
+            # Add price cache cleanup task (every 2 minutes)
+            from services.price_cache import clear_expired_prices
+            task_scheduler.add_interval_task(
+                task_func=clear_expired_prices,
+                interval_seconds=120,  # Clean every 2 minutes
+                task_id="price_cache_cleanup"
+            )
+            logger.info("Price cache cleanup task started (2-minute interval)")
 
         # Check AI trading configuration status
         _check_ai_trading_status()
@@ -51,18 +48,18 @@ def initialize_services():
 def _check_ai_trading_status():
     """Check and report AI trading configuration status on startup"""
     try:
-        from database.connection import SessionLocal
-        from services.ai_decision_service import get_active_ai_accounts
+        # Imported lazily: ai_decision_service pulls in the market data / exchange stack
+        from services.ai_decision_service import get_active_ai_account_display
 
         db = SessionLocal()
         try:
-            accounts = get_active_ai_accounts(db)
+            accounts = get_active_ai_account_display(db)
             if accounts:
                 logger.info("=" * 60)
                 logger.info("✓ AI TRADING IS ACTIVE")
                 logger.info(f"  Active Accounts: {len(accounts)}")
-                for acc in accounts:
-                    logger.info(f"    - {acc.name} (Model: {acc.model})")
+                for name, model in accounts:
+                    logger.info(f"    - {name} (Model: {model})")
                 logger.info("  Trading Interval: Every 5 minutes")
                 logger.info("=" * 60)
             else:
@@ -110,6 +107,7 @@ def schedule_auto_trading(interval_seconds: int = 300, max_ratio: float = 0.2, u
         max_ratio: Maximum portion of portfolio to use per trade
         use_ai: If True, use AI-driven trading; if False, use random trading
     """
+    # Imported lazily to keep the trading stack out of module import time
     from services.auto_trader import (
         place_ai_driven_crypto_order,
         place_random_crypto_order,